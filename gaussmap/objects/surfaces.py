@@ -1,4 +1,6 @@
 """Contains classes for a parameterized surface and its Gauss map."""
+from typing import Optional, Sequence, Tuple, Union
+
 import manim
 import numpy as np
 import numpy.typing as npt
@@ -6,6 +8,85 @@ import numpy.typing as npt
 from gaussmap.typing import Range, Vectorization
 from gaussmap.utils import utils
 
+# Fraction of a grid step within which a value counts as on the grid
+_GRID_TOLERANCE = 1e-9
+
+
+class _SampleGrid:
+    """The u and v values at which manim evaluates a surface.
+
+    manim draws each face of a surface as straight bezier curves along the
+    edges of its uv grid. Besides the grid values themselves, it evaluates
+    the surface at the handles one and two thirds of the way between them,
+    so the values form a grid three times finer than the resolution.
+    """
+
+    def __init__(
+        self, u_range: Range, v_range: Range, resolution: Union[int, Sequence[int]]
+    ) -> None:
+        """Compute the grid for a surface.
+
+        Args:
+            u_range: A tuple containing the starting and ending u
+                coordinates.
+            v_range: A tuple containing the starting and ending v
+                coordinates.
+            resolution: The resolution of the manim surface, either a
+                single int or a (u resolution, v resolution) pair.
+        """
+        # Read the resolution the same way manim.Surface does
+        if isinstance(resolution, int):
+            u_resolution = v_resolution = resolution
+        else:
+            u_resolution, v_resolution = resolution
+
+        self.u_values = self.__get_values(u_range, u_resolution)
+        self.v_values = self.__get_values(v_range, v_resolution)
+
+        self.__u_scale = self.__get_scale(u_range, u_resolution)
+        self.__v_scale = self.__get_scale(v_range, v_resolution)
+
+    def get_index(self, u_value: float, v_value: float) -> Optional[Tuple[int, int]]:
+        """Find the indices of a u and v pair in the grid.
+
+        Returns:
+            The indices of u_value in u_values and v_value in v_values, or
+            None if either value is not on the grid.
+        """
+        i = self.__get_value_index(self.u_values, self.__u_scale, u_value)
+        j = self.__get_value_index(self.v_values, self.__v_scale, v_value)
+        if i is None or j is None:
+            return None
+
+        return i, j
+
+    @staticmethod
+    def __get_values(value_range: Range, resolution: int) -> npt.NDArray[np.float64]:
+        values = np.linspace(value_range[0], value_range[1], resolution + 1)
+
+        # Interpolate between the grid values like manim places the handles
+        steps = np.linspace(0, 1, 4)[:-1, np.newaxis]
+        thirds = (1 - steps) * values[:-1] + steps * values[1:]
+
+        return np.append(thirds.T, values[-1])
+
+    @staticmethod
+    def __get_scale(value_range: Range, resolution: int) -> float:
+        span = value_range[1] - value_range[0]
+        return 3 * resolution / span if span else 0.0
+
+    @staticmethod
+    def __get_value_index(
+        values: npt.NDArray[np.float64], scale: float, value: float
+    ) -> Optional[int]:
+        # Handles on the edges of a face can be off the grid by rounding
+        position = (value - values[0]) * scale
+        index = round(position)
+        if 0 <= index < len(values) and abs(position - index) < _GRID_TOLERANCE:
+            return index
+
+        return None
+
 
 class OriginalSurface(manim.Surface):
     """A manim surface of the parameterization for the manimation."""
@@ -21,7 +102,7 @@ class OriginalSurface(manim.Surface):
         """Generate the parameterized surface for the manimation.
 
         Args:
-            vectorization: A tuple of vectorized functions that describes
+            vectorization: A vectorized function that describes
                 the parameterized surface.
             u_range: A tuple containing the starting and ending u
                 coordinates.
@@ -32,19 +113,27 @@ class OriginalSurface(manim.Surface):
         self.__max_radius = max_radius
         self.__vectorization = vectorization
 
+        # Evaluate every point manim samples the surface at in one pass
+        self.__grid = _SampleGrid(u_range, v_range, kwargs.get("resolution", 32))
+        evaluations = utils.evaluate_grid(
+            vectorization, self.__grid.u_values, self.__grid.v_values
+        )
+        self.__samples = utils.limit_radius(evaluations, max_radius)
+
         super().__init__(self.func, u_range=u_range, v_range=v_range, **kwargs)
 
     def func(self, u_value: float, v_value: float) -> npt.NDArray[np.float64]:
         """Evaluate the function at u and v to generate the surface."""
+        index = self.__grid.get_index(u_value, v_value)
+        if index is not None:
+            return self.__samples[index]
+
         evaluation = utils.evaluate(self.__vectorization, u_value, v_value)
+        radius = utils.norm(evaluation)
 
         # Limit graphs to sphere with radius r_max
         # a spherical boundary looks better than a cubic one
-        radius = np.linalg.norm(evaluation)
-        if radius > self.__max_radius:
-            evaluation = np.divide(np.multiply(self.__max_radius, evaluation), radius)
-
-        return evaluation
+        return evaluation * (self.__max_radius / max(radius, self.__max_radius))
 
 
 class GaussMapSurface(manim.Surface):
@@ -60,7 +149,7 @@ class GaussMapSurface(manim.Surface):
         """Generate the Gauss map surface for the manimation.
 
         Args:
-            normal_vectorization: A tuple of vectorized functions that
+            normal_vectorization: A vectorized function that
                 describes the normal vectors of the original surface.
             u_range: A tuple containing the starting and ending u
                 coordinates.
@@ -69,10 +158,21 @@ class GaussMapSurface(manim.Surface):
         """
         self.__normal_vectorization = normal_vectorization
 
+        # Like OriginalSurface, normalize every point manim samples at once
+        self.__grid = _SampleGrid(u_range, v_range, kwargs.get("resolution", 32))
+        normal_evaluations = utils.evaluate_grid(
+            normal_vectorization, self.__grid.u_values, self.__grid.v_values
+        )
+        self.__samples = utils.normalize(normal_evaluations)
+
         super().__init__(self.func, u_range=u_range, v_range=v_range, **kwargs)
 
     def func(self, u_value: float, v_value: float) -> npt.NDArray[np.float64]:
         """Evaluate the normal vectors at u and v to generate the surface."""
+        index = self.__grid.get_index(u_value, v_value)
+        if index is not None:
+            return self.__samples[index]
+
         normal_evaluation = utils.evaluate(
             self.__normal_vectorization, u_value, v_value
         )
@@ -93,7 +193,7 @@ class GaussMapParametricFunction(manim.ParametricFunction):
         """Generate the Gauss map parametric function for the manimation.
 
         Args:
-            normal_vectorization: A tuple of vectorized functions that
+            normal_vectorization: A vectorized function that
                 describes the normal vectors of the original surface.
             t_range: A tuple containing the starting and ending t
                 coordinates.
@@ -104,10 +204,24 @@ class GaussMapParametricFunction(manim.ParametricFunction):
         self.__t_range = t_range
         self.__is_u_function = is_u_function
 
+        # manim samples t in its default steps of 0.01 and includes the end
+        t_values = np.append(np.arange(t_range[0], t_range[1], 0.01), t_range[1])
+        if is_u_function:
+            normal_evaluations = utils.evaluate(normal_vectorization, t_values, 1)
+        else:
+            normal_evaluations = utils.evaluate(normal_vectorization, 1, t_values)
+
+        self.__t_indices = {t_value: i for i, t_value in enumerate(t_values)}
+        self.__samples = utils.normalize(normal_evaluations)
+
         super().__init__(self.func, t_range=t_range, **kwargs)
 
     def func(self, t_value: float) -> npt.NDArray[np.float64]:
         """Evaluate the normal vectors at t to generate the function."""
+        i = self.__t_indices.get(t_value)
+        if i is not None:
+            return self.__samples[i]
+
         # The evaluation is done at 1 so that the denominator is
         # unlikely to be zero when normalizing.
         if self.__is_u_function:
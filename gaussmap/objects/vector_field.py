@@ -7,6 +7,22 @@ from gaussmap.typing import Range, Vectorization
 from gaussmap.utils import utils
 
 
+class _FieldVector(manim.Vector):
+    """A manim vector that is hidden behind 3d objects."""
+
+    def __init__(self, direction: npt.NDArray[np.float64]) -> None:
+        super().__init__(direction=direction)
+        tip = self.get_tip()
+
+        # shade_in_3d and depth_test prevent vectors and their tips from being
+        # visible when they are behind 3d objects. shade_in_3d is for the
+        # Cairo renderer and depth_test is for the OpenGL Renderer.
+        for attribute in ("shade_in_3d", "depth_test"):
+            for mobject in (self, tip):
+                if hasattr(mobject, attribute):
+                    setattr(mobject, attribute, True)
+
+
 class VectorField(manim.VGroup):
     """The normal vectors as a group of manim vectors for the manimation."""
 
@@ -23,9 +39,9 @@ class VectorField(manim.VGroup):
         """Generate the normal vector field for the manimation.
 
         Args:
-            vectorization: A tuple of vectorized functions that describes
+            vectorization: A vectorized function that describes
                 the original surface.
-            normal_vectorization: A tuple of vectorized functions that
+            normal_vectorization: A vectorized function that
                 describes the normal vectors of the original surface.
             u_range: A tuple containing the starting and ending u
                 coordinates.
@@ -42,17 +58,22 @@ class VectorField(manim.VGroup):
         u_values = np.linspace(u_range[0], u_range[1], amount)
         v_values = np.linspace(v_range[0], v_range[1], amount)
 
-        for u_value in u_values:
-            for v_value in v_values:
-                evaluation = utils.evaluate(vectorization, u_value, v_value)
-                normal_evaluation = utils.evaluate(
-                    normal_vectorization, u_value, v_value
-                )
+        # Evaluate every sample at once, one point per row
+        evaluations = utils.evaluate_grid(vectorization, u_values, v_values)
+        normal_evaluations = utils.evaluate_grid(
+            normal_vectorization, u_values, v_values
+        )
+        evaluations = evaluations.reshape(-1, 3)
+        normal_evaluations = normal_evaluations.reshape(-1, 3)
 
-                # Ignore vectors that start outside a sphere of radius r_max
-                radius = np.linalg.norm(evaluation)
-                if radius < self.__max_radius:
-                    self.add(self.__create_vector(evaluation, normal_evaluation))
+        # Ignore vectors that start outside a sphere of radius r_max
+        radii = np.linalg.norm(evaluations, axis=-1)
+        is_inside = radii < self.__max_radius
+
+        for evaluation, normal_evaluation in zip(
+            evaluations[is_inside], normal_evaluations[is_inside]
+        ):
+            self.add(self.__create_vector(evaluation, normal_evaluation))
 
     @staticmethod
     def __create_vector(
@@ -64,19 +85,4 @@ class VectorField(manim.VGroup):
         # Move vector away from the surface a bit so it does not clip through
         position = position + 0.1 * normal_vector
 
-        vector = manim.Vector(direction=normal_vector).shift(position)
-
-        # shade_in_3d and depth_test prevent vectors and their tips from being
-        # visible when they are behind 3d objects. shade_in_3d is for the
-        # Cairo renderer and depth_test is for the OpenGL Renderer.
-        if hasattr(vector, "shade_in_3d"):
-            vector.shade_in_3d = True
-        if hasattr(vector.get_tip(), "shade_in_3d"):
-            vector.get_tip().shade_in_3d = True
-
-        if hasattr(vector, "depth_test"):
-            vector.depth_test = True
-        if hasattr(vector.get_tip(), "depth_test"):
-            vector.get_tip().depth_test = True
-
-        return vector
+        return _FieldVector(normal_vector).shift(position)
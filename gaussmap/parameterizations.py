@@ -1,12 +1,14 @@
 """Contains classes describing various common parameterizations."""
 from dataclasses import dataclass
-from typing import List
+from functools import cached_property
+from typing import List, Tuple
 
 import numpy as np
 import sympy as sym
 from sympy.abc import u, v
 
 from gaussmap.typing import Expression, Range, Vectorization
+from gaussmap.utils import utils
 
 
 @dataclass(frozen=True)
@@ -23,6 +25,13 @@ class Parameterization:
     v_range: Range
     is_gauss_map_1d: bool
     is_gauss_map_inward: bool
+    is_gauss_map_u_function: bool
+    is_gauss_map_v_function: bool
+
+    @cached_property
+    def unit_normal_vectorization(self) -> Vectorization:
+        """Vectorized functions of the unit normal, computed on first use."""
+        return utils.normalize_vectorization(self.normal_vectorization)
 
 
 @dataclass(frozen=True)
@@ -30,39 +39,23 @@ class CatenoidParameterization(Parameterization):
     """A parameterization of a catenoid centered at the origin."""
 
     @staticmethod
-    def _x(u: float, v: float) -> float:
-        return 2 * np.cosh(0.5 * v) * np.cos(u)
-
-    @staticmethod
-    def _y(u: float, v: float) -> float:
-        return 2 * np.cosh(0.5 * v) * np.sin(u)
+    def _vectorization(u: float, v: float) -> Tuple[float, float, float]:
+        radius = 2 * np.cosh(0.5 * v)
 
-    @staticmethod
-    def _z(u: float, v: float) -> float:
-        return v
+        return radius * np.cos(u), radius * np.sin(u), v
 
     @staticmethod
-    def _normal_x(u: float, v: float) -> float:
-        return 2 * np.cos(u) * np.cosh(0.5 * v)
+    def _normal_vectorization(u: float, v: float) -> Tuple[float, float, float]:
+        radius = 2 * np.cosh(0.5 * v)
 
-    @staticmethod
-    def _normal_y(u: float, v: float) -> float:
-        return 2 * np.sin(u) * np.cosh(0.5 * v)
-
-    @staticmethod
-    def _normal_z(u: float, v: float) -> float:
-        return -1 * np.sinh(v)
+        return radius * np.cos(u), radius * np.sin(u), -np.sinh(v)
 
     expression: Expression = (
         2 * sym.cosh(0.5 * v) * sym.cos(u),
         2 * sym.cosh(0.5 * v) * sym.sin(u),
         v,
     )
-    vectorization: Vectorization = (
-        np.vectorize(_x.__get__(object)),
-        np.vectorize(_y.__get__(object)),
-        np.vectorize(_z.__get__(object)),
-    )
+    vectorization: Vectorization = _vectorization.__get__(object)
     partial_u_expression: Expression = (
         -2 * sym.cosh(0.5 * v) * sym.sin(u),
         2 * sym.cosh(0.5 * v) * sym.cos(u),
@@ -78,15 +71,13 @@ class CatenoidParameterization(Parameterization):
         2 * sym.sin(u) * sym.cosh(0.5 * v),
         -sym.sinh(v),
     )
-    normal_vectorization: Vectorization = (
-        np.vectorize(_normal_x.__get__(object)),
-        np.vectorize(_normal_y.__get__(object)),
-        np.vectorize(_normal_z.__get__(object)),
-    )
+    normal_vectorization: Vectorization = _normal_vectorization.__get__(object)
     u_range: Range = (-np.pi, np.pi)
     v_range: Range = (-2, 2)
     is_gauss_map_1d: bool = False
     is_gauss_map_inward: bool = False
+    is_gauss_map_u_function: bool = True
+    is_gauss_map_v_function: bool = True
 
 
 @dataclass(frozen=True)
@@ -94,48 +85,26 @@ class ConeParameterization(Parameterization):
     """A parameterization of an upper half cone centered along the z-axis."""
 
     @staticmethod
-    def _x(u: float, v: float) -> float:
-        return v * np.cos(u)
-
-    @staticmethod
-    def _y(u: float, v: float) -> float:
-        return v * np.sin(u)
+    def _vectorization(u: float, v: float) -> Tuple[float, float, float]:
+        return v * np.cos(u), v * np.sin(u), v
 
     @staticmethod
-    def _z(u: float, v: float) -> float:
-        return v
-
-    @staticmethod
-    def _normal_x(u: float, v: float) -> float:
-        return v * np.cos(u)
-
-    @staticmethod
-    def _normal_y(u: float, v: float) -> float:
-        return v * np.sin(u)
-
-    @staticmethod
-    def _normal_z(u: float, v: float) -> float:
-        return v
+    def _normal_vectorization(u: float, v: float) -> Tuple[float, float, float]:
+        return v * np.cos(u), v * np.sin(u), -v
 
     expression: Expression = (v * sym.cos(u), v * sym.sin(u), v)
-    vectorization: Vectorization = (
-        np.vectorize(_x.__get__(object)),
-        np.vectorize(_y.__get__(object)),
-        np.vectorize(_z.__get__(object)),
-    )
+    vectorization: Vectorization = _vectorization.__get__(object)
     partial_u_expression: Expression = (-v * sym.sin(u), v * sym.cos(u), sym.sympify(0))
     partial_v_expression: Expression = (sym.cos(u), sym.sin(u), sym.sympify(1))
     normal_expression: Expression = (v * sym.cos(u), v * sym.sin(u), -v)
-    normal_vectorization: Vectorization = (
-        np.vectorize(_normal_x.__get__(object)),
-        np.vectorize(_normal_y.__get__(object)),
-        np.vectorize(_normal_z.__get__(object)),
-    )
+    normal_vectorization: Vectorization = _normal_vectorization.__get__(object)
     u_range: Range = (0, 2 * np.pi)
     # 0.01 is used to avoid singular point.
     v_range: Range = (0.01, 1)
     is_gauss_map_1d: bool = True
     is_gauss_map_inward: bool = False
+    is_gauss_map_u_function: bool = True
+    is_gauss_map_v_function: bool = False
 
 
 @dataclass(frozen=True)
@@ -143,47 +112,25 @@ class CylinderParameterization(Parameterization):
     """A parameterization of a cylinder centered along the z-axis."""
 
     @staticmethod
-    def _x(u: float, v: float) -> float:
-        return np.cos(u)
-
-    @staticmethod
-    def _y(u: float, v: float) -> float:
-        return np.sin(u)
+    def _vectorization(u: float, v: float) -> Tuple[float, float, float]:
+        return np.cos(u), np.sin(u), v
 
     @staticmethod
-    def _z(u: float, v: float) -> float:
-        return v
-
-    @staticmethod
-    def _normal_x(u: float, v: float) -> float:
-        return np.cos(u)
-
-    @staticmethod
-    def _normal_y(u: float, v: float) -> float:
-        return np.sin(u)
-
-    @staticmethod
-    def _normal_z(u: float, v: float) -> float:
-        return 0
+    def _normal_vectorization(u: float, v: float) -> Tuple[float, float, float]:
+        return np.cos(u), np.sin(u), 0
 
     expression: Expression = (sym.cos(u), sym.sin(u), v)
-    vectorization: Vectorization = (
-        np.vectorize(_x.__get__(object)),
-        np.vectorize(_y.__get__(object)),
-        np.vectorize(_z.__get__(object)),
-    )
+    vectorization: Vectorization = _vectorization.__get__(object)
     partial_u_expression: Expression = (-sym.sin(u), sym.cos(u), sym.sympify(0))
     partial_v_expression: Expression = (sym.sympify(0), sym.sympify(0), sym.sympify(1))
     normal_expression: Expression = (sym.cos(u), sym.sin(u), sym.sympify(0))
-    normal_vectorization: Vectorization = (
-        np.vectorize(_normal_x.__get__(object)),
-        np.vectorize(_normal_y.__get__(object)),
-        np.vectorize(_normal_z.__get__(object)),
-    )
+    normal_vectorization: Vectorization = _normal_vectorization.__get__(object)
     u_range: Range = (0, 2 * np.pi)
     v_range: Range = (-1, 1)
     is_gauss_map_1d: bool = True
     is_gauss_map_inward: bool = False
+    is_gauss_map_u_function: bool = True
+    is_gauss_map_v_function: bool = False
 
 
 @dataclass(frozen=True)
@@ -191,51 +138,25 @@ class HyperbolicParaboloidParameterization(Parameterization):
     """A parameterization of a hyperbolic paraboloid centered at the origin."""
 
     @staticmethod
-    def _x(u: float, v: float) -> float:
-        return u
+    def _vectorization(u: float, v: float) -> Tuple[float, float, float]:
+        return u, v, u * v
 
     @staticmethod
-    def _y(u: float, v: float) -> float:
-        return v
-
-    @staticmethod
-    def _z(u: float, v: float) -> float:
-        return u * v
-
-    @staticmethod
-    def _normal_x(u: float, v: float) -> float:
-        return -1 * np.cos(u) * np.sin(v) ** 2
-
-    @staticmethod
-    def _normal_y(u: float, v: float) -> float:
-        return -1 * np.sin(u) * np.sin(v) ** 2
-
-    @staticmethod
-    def _normal_z(u: float, v: float) -> float:
-        return -0.5 * np.sin(2 * v)
+    def _normal_vectorization(u: float, v: float) -> Tuple[float, float, float]:
+        return -v, -u, 1
 
     expression: Expression = (u, v, u * v)
-    vectorization: Vectorization = (
-        np.vectorize(_x.__get__(object)),
-        np.vectorize(_y.__get__(object)),
-        np.vectorize(_z.__get__(object)),
-    )
+    vectorization: Vectorization = _vectorization.__get__(object)
     partial_u_expression: Expression = (sym.sympify(1), sym.sympify(0), v)
     partial_v_expression: Expression = (sym.sympify(0), sym.sympify(1), u)
-    normal_expression: Expression = (
-        -sym.cos(u) * sym.sin(v) ** 2,
-        -sym.sin(u) * sym.sin(v) ** 2,
-        -0.5 * sym.sin(2 * v),
-    )
-    normal_vectorization: Vectorization = (
-        np.vectorize(_normal_x.__get__(object)),
-        np.vectorize(_normal_y.__get__(object)),
-        np.vectorize(_normal_z.__get__(object)),
-    )
+    normal_expression: Expression = (-v, -u, sym.sympify(1))
+    normal_vectorization: Vectorization = _normal_vectorization.__get__(object)
     u_range: Range = (-2, 2)
     v_range: Range = (-2, 2)
     is_gauss_map_1d: bool = False
     is_gauss_map_inward: bool = False
+    is_gauss_map_u_function: bool = True
+    is_gauss_map_v_function: bool = True
 
 
 @dataclass(frozen=True)
@@ -243,39 +164,23 @@ class HyperboloidParameterization(Parameterization):
     """A parameterization of a hyperboloid centered along the z-axis."""
 
     @staticmethod
-    def _x(u: float, v: float) -> float:
-        return np.cosh(u) * np.cos(v)
-
-    @staticmethod
-    def _y(u: float, v: float) -> float:
-        return np.cosh(u) * np.sin(v)
-
-    @staticmethod
-    def _z(u: float, v: float) -> float:
-        return np.sinh(u)
+    def _vectorization(u: float, v: float) -> Tuple[float, float, float]:
+        radius = np.cosh(u)
 
-    @staticmethod
-    def _normal_x(u: float, v: float) -> float:
-        return -1 * np.cos(v) * np.cosh(u) ** 2
+        return radius * np.cos(v), radius * np.sin(v), np.sinh(u)
 
     @staticmethod
-    def _normal_y(u: float, v: float) -> float:
-        return -1 * np.sin(v) * np.cosh(u) ** 2
+    def _normal_vectorization(u: float, v: float) -> Tuple[float, float, float]:
+        scale = -(np.cosh(u) ** 2)
 
-    @staticmethod
-    def _normal_z(u: float, v: float) -> float:
-        return 0.5 * np.sinh(2 * u)
+        return scale * np.cos(v), scale * np.sin(v), 0.5 * np.sinh(2 * u)
 
     expression: Expression = (
         sym.cosh(u) * sym.cos(v),
         sym.cosh(u) * sym.sin(v),
         sym.sinh(u),
     )
-    vectorization: Vectorization = (
-        np.vectorize(_x.__get__(object)),
-        np.vectorize(_y.__get__(object)),
-        np.vectorize(_z.__get__(object)),
-    )
+    vectorization: Vectorization = _vectorization.__get__(object)
     partial_u_expression: Expression = (
         sym.sinh(u) * sym.cos(v),
         sym.sinh(u) * sym.sin(v),
@@ -291,15 +196,13 @@ class HyperboloidParameterization(Parameterization):
         -sym.sin(v) * sym.cosh(u) ** 2,
         0.5 * sym.sinh(2 * u),
     )
-    normal_vectorization: Vectorization = (
-        np.vectorize(_normal_x.__get__(object)),
-        np.vectorize(_normal_y.__get__(object)),
-        np.vectorize(_normal_z.__get__(object)),
-    )
+    normal_vectorization: Vectorization = _normal_vectorization.__get__(object)
     u_range: Range = (-2 * np.pi, 2 * np.pi)
     v_range: Range = (0, 2 * np.pi)
     is_gauss_map_1d: bool = False
     is_gauss_map_inward: bool = True
+    is_gauss_map_u_function: bool = True
+    is_gauss_map_v_function: bool = True
 
 
 @dataclass(frozen=True)
@@ -307,35 +210,15 @@ class MonkeySaddleParameterization(Parameterization):
     """A parameterization of a monkey saddle centered at the origin."""
 
     @staticmethod
-    def _x(u: float, v: float) -> float:
-        return u
-
-    @staticmethod
-    def _y(u: float, v: float) -> float:
-        return v
-
-    @staticmethod
-    def _z(u: float, v: float) -> float:
-        return u**3 - 3 * u * v**2
+    def _vectorization(u: float, v: float) -> Tuple[float, float, float]:
+        return u, v, u**3 - 3 * u * v**2
 
     @staticmethod
-    def _normal_x(u: float, v: float) -> float:
-        return -3 * u**2 + 3 * v**2
-
-    @staticmethod
-    def _normal_y(u: float, v: float) -> float:
-        return 6 * u * v
-
-    @staticmethod
-    def _normal_z(u: float, v: float) -> float:
-        return 1
+    def _normal_vectorization(u: float, v: float) -> Tuple[float, float, float]:
+        return -3 * u**2 + 3 * v**2, 6 * u * v, 1
 
     expression: Expression = (u, v, u**3 - 3 * u * v**2)
-    vectorization: Vectorization = (
-        np.vectorize(_x.__get__(object)),
-        np.vectorize(_y.__get__(object)),
-        np.vectorize(_z.__get__(object)),
-    )
+    vectorization: Vectorization = _vectorization.__get__(object)
     partial_u_expression: Expression = (
         sym.sympify(1),
         sym.sympify(0),
@@ -343,19 +226,17 @@ class MonkeySaddleParameterization(Parameterization):
     )
     partial_v_expression: Expression = (sym.sympify(0), sym.sympify(1), -6 * u * v)
     normal_expression: Expression = (
-        -3 * u**2 + 2 * v**2,
-        4 * u * v,
+        -3 * u**2 + 3 * v**2,
+        6 * u * v,
         sym.sympify(1),
     )
-    normal_vectorization: Vectorization = (
-        np.vectorize(_normal_x.__get__(object)),
-        np.vectorize(_normal_y.__get__(object)),
-        np.vectorize(_normal_z.__get__(object)),
-    )
+    normal_vectorization: Vectorization = _normal_vectorization.__get__(object)
     u_range: Range = (-3, 3)
     v_range: Range = (-3, 3)
     is_gauss_map_1d: bool = False
     is_gauss_map_inward: bool = False
+    is_gauss_map_u_function: bool = True
+    is_gauss_map_v_function: bool = True
 
 
 @dataclass(frozen=True)
@@ -363,35 +244,17 @@ class ParaboloidParameterization(Parameterization):
     """A parameterization of a paraboloid opening towards negative z."""
 
     @staticmethod
-    def _x(u: float, v: float) -> float:
-        return v * np.cos(u)
-
-    @staticmethod
-    def _y(u: float, v: float) -> float:
-        return v * np.sin(u)
-
-    @staticmethod
-    def _z(u: float, v: float) -> float:
-        return -1 * v**2
+    def _vectorization(u: float, v: float) -> Tuple[float, float, float]:
+        return v * np.cos(u), v * np.sin(u), -(v**2)
 
     @staticmethod
-    def _normal_x(u: float, v: float) -> float:
-        return -2 * v**2 * np.cos(u)
+    def _normal_vectorization(u: float, v: float) -> Tuple[float, float, float]:
+        scale = -2 * v**2
 
-    @staticmethod
-    def _normal_y(u: float, v: float) -> float:
-        return -2 * v**2 * np.sin(u)
-
-    @staticmethod
-    def _normal_z(u: float, v: float) -> float:
-        return -1 * v
+        return scale * np.cos(u), scale * np.sin(u), -v
 
     expression: Expression = (v * sym.cos(u), v * sym.sin(u), -(v**2))
-    vectorization: Vectorization = (
-        np.vectorize(_x.__get__(object)),
-        np.vectorize(_y.__get__(object)),
-        np.vectorize(_z.__get__(object)),
-    )
+    vectorization: Vectorization = _vectorization.__get__(object)
     partial_u_expression: Expression = (-v * sym.sin(u), v * sym.cos(u), sym.sympify(0))
     partial_v_expression: Expression = (sym.cos(u), sym.sin(u), -2 * v)
     normal_expression: Expression = (
@@ -399,16 +262,14 @@ class ParaboloidParameterization(Parameterization):
         -2 * v**2 * sym.sin(u),
         -v,
     )
-    normal_vectorization: Vectorization = (
-        np.vectorize(_normal_x.__get__(object)),
-        np.vectorize(_normal_y.__get__(object)),
-        np.vectorize(_normal_z.__get__(object)),
-    )
+    normal_vectorization: Vectorization = _normal_vectorization.__get__(object)
     u_range: Range = (0, 2 * np.pi)
     # 0.01 is used to avoid singular point.
     v_range: Range = (0.01, 2)
     is_gauss_map_1d: bool = False
     is_gauss_map_inward: bool = True
+    is_gauss_map_u_function: bool = True
+    is_gauss_map_v_function: bool = True
 
 
 @dataclass(frozen=True)
@@ -416,39 +277,25 @@ class RingTorusParameterization(Parameterization):
     """A parameterization of a torus with major radius 3 and minor radius 1."""
 
     @staticmethod
-    def _x(u: float, v: float) -> float:
-        return (3 + np.cos(u)) * np.cos(v)
+    def _vectorization(u: float, v: float) -> Tuple[float, float, float]:
+        radius = 3 + np.cos(u)
 
-    @staticmethod
-    def _y(u: float, v: float) -> float:
-        return (3 + np.cos(u)) * np.sin(v)
+        return radius * np.cos(v), radius * np.sin(v), np.sin(u)
 
     @staticmethod
-    def _z(u: float, v: float) -> float:
-        return np.sin(u)
+    def _normal_vectorization(u: float, v: float) -> Tuple[float, float, float]:
+        cos_u = np.cos(u)
+        radius = 3 + cos_u
+        scale = -radius * cos_u
 
-    @staticmethod
-    def _normal_x(u: float, v: float) -> float:
-        return -1 * (3 + np.cos(u)) * np.cos(u) * np.cos(v)
-
-    @staticmethod
-    def _normal_y(u: float, v: float) -> float:
-        return -1 * (3 + np.cos(u)) * np.cos(u) * np.sin(v)
-
-    @staticmethod
-    def _normal_z(u: float, v: float) -> float:
-        return -1 * (3 + np.cos(u)) * np.sin(u)
+        return scale * np.cos(v), scale * np.sin(v), -radius * np.sin(u)
 
     expression: Expression = (
         (3 + sym.cos(u)) * sym.cos(v),
         (3 + sym.cos(u)) * sym.sin(v),
         sym.sin(u),
     )
-    vectorization: Vectorization = (
-        np.vectorize(_x.__get__(object)),
-        np.vectorize(_y.__get__(object)),
-        np.vectorize(_z.__get__(object)),
-    )
+    vectorization: Vectorization = _vectorization.__get__(object)
     partial_u_expression: Expression = (
         -sym.sin(u) * sym.cos(v),
         -sym.sin(u) * sym.sin(v),
@@ -464,15 +311,13 @@ class RingTorusParameterization(Parameterization):
         -(3 + sym.cos(u)) * sym.cos(u) * sym.sin(v),
         -(3 + sym.cos(u)) * sym.sin(u),
     )
-    normal_vectorization: Vectorization = (
-        np.vectorize(_normal_x.__get__(object)),
-        np.vectorize(_normal_y.__get__(object)),
-        np.vectorize(_normal_z.__get__(object)),
-    )
+    normal_vectorization: Vectorization = _normal_vectorization.__get__(object)
     u_range: Range = (0, 2 * np.pi)
     v_range: Range = (0, 2 * np.pi)
     is_gauss_map_1d: bool = False
     is_gauss_map_inward: bool = True
+    is_gauss_map_u_function: bool = True
+    is_gauss_map_v_function: bool = True
 
 
 @dataclass(frozen=True)
@@ -480,39 +325,24 @@ class SphereParameterization(Parameterization):
     """A parameterization of a sphere with radius 1 centered at the origin."""
 
     @staticmethod
-    def _x(u: float, v: float) -> float:
-        return np.cos(u) * np.sin(v)
-
-    @staticmethod
-    def _y(u: float, v: float) -> float:
-        return np.sin(u) * np.sin(v)
-
-    @staticmethod
-    def _z(u: float, v: float) -> float:
-        return np.cos(v)
+    def _vectorization(u: float, v: float) -> Tuple[float, float, float]:
+        sin_v = np.sin(v)
 
-    @staticmethod
-    def _normal_x(u: float, v: float) -> float:
-        return -1 * np.sin(v) ** 2 * np.cos(u)
+        return np.cos(u) * sin_v, np.sin(u) * sin_v, np.cos(v)
 
     @staticmethod
-    def _normal_y(u: float, v: float) -> float:
-        return -1 * np.sin(v) ** 2 * np.sin(u)
+    def _normal_vectorization(u: float, v: float) -> Tuple[float, float, float]:
+        sin_v = np.sin(v)
+        scale = -(sin_v**2)
 
-    @staticmethod
-    def _normal_z(u: float, v: float) -> float:
-        return -1 * np.cos(v) * np.sin(v)
+        return scale * np.cos(u), scale * np.sin(u), -np.cos(v) * sin_v
 
     expression: Expression = (
         sym.cos(u) * sym.sin(v),
         sym.sin(u) * sym.sin(v),
         sym.cos(v),
     )
-    vectorization: Vectorization = (
-        np.vectorize(_x.__get__(object)),
-        np.vectorize(_y.__get__(object)),
-        np.vectorize(_z.__get__(object)),
-    )
+    vectorization: Vectorization = _vectorization.__get__(object)
     partial_u_expression: Expression = (
         -sym.sin(u) * sym.sin(v),
         sym.cos(u) * sym.sin(v),
@@ -528,16 +358,14 @@ class SphereParameterization(Parameterization):
         -sym.sin(v) ** 2 * sym.sin(u),
         -sym.cos(v) * sym.sin(v),
     )
-    normal_vectorization: Vectorization = (
-        np.vectorize(_normal_x.__get__(object)),
-        np.vectorize(_normal_y.__get__(object)),
-        np.vectorize(_normal_z.__get__(object)),
-    )
+    normal_vectorization: Vectorization = _normal_vectorization.__get__(object)
     u_range: Range = (0, 2 * np.pi)
     # 0.01 is used to avoid the two singular points at the poles.
     v_range: Range = (0.01, np.pi - 0.01)
     is_gauss_map_1d: bool = False
     is_gauss_map_inward: bool = True
+    is_gauss_map_u_function: bool = True
+    is_gauss_map_v_function: bool = True
 
 
 parameterization_list: List[Parameterization] = [
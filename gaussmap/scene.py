@@ -1,9 +1,12 @@
 """Contains a class for generating a Gauss map manimation."""
+from typing import Callable, Optional, Union
+
 import manim
 import numpy as np
 import sympy as sym
 
 from gaussmap.objects import surfaces, vector_field
+from gaussmap.parameterizations import Parameterization
 from gaussmap.typing import Expression, Range
 from gaussmap.utils import utils
 
@@ -12,22 +15,77 @@ class GaussMapScene(manim.ThreeDScene):
     """An animated scene that demonstrates the Gauss map of a surface."""
 
     def __init__(
-        self, expression: Expression, u_range: Range, v_range: Range, *args, **kwargs
+        self,
+        expression: Union[Expression, Parameterization],
+        u_range: Range,
+        v_range: Range,
+        *args,
+        **kwargs,
     ) -> None:
-        """Set up the surfaces in the manimation scene."""
+        """Set up the surfaces in the manimation scene.
+
+        When a Parameterization is given instead of an expression its
+        stored partials and normals are used rather than being derived
+        from the expression. Its stored orientation and Gauss map
+        dependence on u and v are also used when u_range and v_range are
+        the parameterization's own ranges.
+        """
         self.gauss_map_surface = None
         self.gauss_map_function = None
-        partial_u_expression, partial_v_expression = utils.compute_partials(expression)
 
-        normal_expression = partial_u_expression.cross(partial_v_expression)
+        parameterization: Optional[Parameterization] = None
+
+        if isinstance(expression, Parameterization):
+            parameterization = expression
+            expression = parameterization.expression
+            partial_u_expression = sym.Matrix(parameterization.partial_u_expression)
+            partial_v_expression = sym.Matrix(parameterization.partial_v_expression)
+            normal_expression = sym.Matrix(parameterization.normal_expression)
+
+            vectorization = parameterization.vectorization
+            normal_vectorization = parameterization.normal_vectorization
+
+            # The stored properties only hold over the stored ranges
+            if (tuple(u_range), tuple(v_range)) != (
+                parameterization.u_range,
+                parameterization.v_range,
+            ):
+                parameterization = None
+        else:
+            partial_u_expression, partial_v_expression = utils.compute_partials(
+                expression
+            )
 
-        vectorization = utils.sympy_to_numpy(expression)
-        normal_vectorization = utils.sympy_to_numpy(normal_expression)
+            normal_expression = partial_u_expression.cross(partial_v_expression)
 
-        if utils.is_inward_field(vectorization, normal_vectorization, u_range, v_range):
-            normal_expression = -1 * normal_expression
+            vectorization = utils.sympy_to_numpy(expression)
             normal_vectorization = utils.sympy_to_numpy(normal_expression)
 
+        if parameterization is not None:
+            is_inward = parameterization.is_gauss_map_inward
+        else:
+            is_inward = utils.is_inward_field(
+                vectorization, normal_vectorization, u_range, v_range
+            )
+
+        if is_inward:
+            normal_expression = -normal_expression
+            normal_vectorization = utils.negate(normal_vectorization)
+
+        if parameterization is not None:
+            is_u_function = parameterization.is_gauss_map_u_function
+            is_v_function = parameterization.is_gauss_map_v_function
+        else:
+            unit_normal_vectorization = utils.normalize_vectorization(
+                normal_vectorization
+            )
+            is_u_function = utils.is_u_function(
+                unit_normal_vectorization, u_range, v_range
+            )
+            is_v_function = utils.is_v_function(
+                unit_normal_vectorization, u_range, v_range
+            )
+
         print(f"x = {expression}")
         print(f"x_u = {partial_u_expression}")
         print(f"x_v = {partial_v_expression}")
@@ -37,15 +95,6 @@ class GaussMapScene(manim.ThreeDScene):
             vectorization, u_range, v_range
         )
 
-        normal_expression_norm = sym.sqrt(normal_expression.dot(normal_expression))
-
-        unit_normal_expression = normal_expression / normal_expression_norm
-
-        unit_normal_vectorization = utils.sympy_to_numpy(unit_normal_expression)
-
-        is_u_function = utils.is_u_function(unit_normal_vectorization, u_range, v_range)
-        is_v_function = utils.is_v_function(unit_normal_vectorization, u_range, v_range)
-
         if is_u_function and is_v_function:
             self.gauss_map_surface = surfaces.GaussMapSurface(
                 normal_vectorization, u_range, v_range
@@ -78,14 +127,14 @@ class GaussMapScene(manim.ThreeDScene):
         self.play(manim.FadeOut(self.original_surface))
         self.remove(self.original_surface)
 
-        animations = []
-        for vector in self.vector_field:
-            middle_vector = np.array(vector.get_vector()) / 2
-            animations.append(
-                manim.ApplyMethod(
-                    vector.move_to, manim.ORIGIN + middle_vector, run_time=0.2
-                )
-            )
+        # Compute every target position at once, one vector per row
+        vectors = np.array([vector.get_vector() for vector in self.vector_field])
+        targets = manim.ORIGIN + vectors.reshape(-1, 3) / 2
+
+        animations = [
+            manim.ApplyMethod(vector.move_to, target, run_time=0.2)
+            for vector, target in zip(self.vector_field, targets)
+        ]
 
         self.play(*animations, run_time=3.0)
         self.wait(2)
@@ -96,3 +145,21 @@ class GaussMapScene(manim.ThreeDScene):
         self.play(manim.FadeOut(self.vector_field))
         self.remove(self.vector_field)
         self.wait(5)
+
+
+class ParameterizationScene(GaussMapScene):
+    """A Gauss map scene of one of the stored parameterizations.
+
+    Subclasses set parameterization_class and the surface is rendered over
+    that parameterization's u and v ranges.
+    """
+
+    parameterization_class: Callable[[], Parameterization]
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Set up the scene from the stored parameterization."""
+        parameterization = self.parameterization_class()
+        u_range = parameterization.u_range
+        v_range = parameterization.v_range
+
+        super().__init__(parameterization, u_range, v_range, *args, **kwargs)
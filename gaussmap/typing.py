@@ -1,7 +1,6 @@
 """Describes types used throughout the Gauss map package."""
-from typing import Tuple, Union
+from typing import Any, Callable, Sequence, Tuple, Union
 
-from numpy import vectorize
 from sympy import Expr, Matrix
 
 Range = Tuple[float, float]
@@ -11,5 +10,6 @@ Matrices = Tuple[Matrix, Matrix]
 # Expression representing x, y, and z coordinates
 Expression = Union[Tuple[Expr, Expr, Expr], Matrix]
 
-# Vectorized function representing x, y, and z coordinates
-Vectorization = Tuple[vectorize, vectorize, vectorize]
+# Vectorized function of u and v returning the x, y, and z coordinates. The
+# function accepts scalar or array u and v values.
+Vectorization = Callable[[Any, Any], Sequence[Any]]
@@ -1,4 +1,5 @@
 """Contains functions to validate parametric functions from user input."""
+from functools import lru_cache
 from typing import Tuple
 
 import sympy as sym
@@ -6,6 +7,48 @@ from sympy.abc import u, v
 
 from gaussmap.typing import Expression, Range
 
+# Characters and names allowed in user input, built once at import
+_BOUND_ALLOWED_CHARS = frozenset([*"pi", *"exp", *"0123456789", *".+-*/^()"])
+_BOUND_ALLOWED_NAMES = {"pi": sym.pi, "exp": sym.exp}
+_FUNCTION_ALLOWED_CHARS = frozenset(
+    [
+        *"cos",
+        *"sin",
+        *"tan",
+        *"csc",
+        *"sec",
+        *"cot",
+        "h",
+        *"exp",
+        *"log",
+        *"pi",
+        "u",
+        "v",
+        *"0123456789",
+        *".+-*/^()",
+        " ",
+    ]
+)
+_FUNCTION_ALLOWED_NAMES = {
+    "cos": sym.cos,
+    "sin": sym.sin,
+    "tan": sym.tan,
+    "csc": sym.csc,
+    "sec": sym.sec,
+    "cot": sym.cot,
+    "cosh": sym.cosh,
+    "sinh": sym.sinh,
+    "tanh": sym.tanh,
+    "csch": sym.csch,
+    "sech": sym.sech,
+    "coth": sym.coth,
+    "exp": sym.exp,
+    "log": sym.log,
+    "pi": sym.pi,
+    "u": u,
+    "v": v,
+}
+
 
 def _validate_bound(bound: str, bound_name: str) -> float:
     """Validate input and evaluates the expression for the boundaries.
@@ -33,20 +76,22 @@ def _validate_bound(bound: str, bound_name: str) -> float:
         SyntaxError: The expression could not be parsed by eval.
         SympifyError: The expression could not be parsed by SymPy.
     """
-    allowed_chars = [*"pi", *"exp", *"0123456789", *".+-*/^()"]
-    allowed_names = {"pi": sym.pi, "exp": sym.exp}
-
-    if not all([char in allowed_chars for char in bound]):
-        raise ValueError(f"Unallowed character found in {bound_name}")
+    unallowed_chars = set(bound) - _BOUND_ALLOWED_CHARS
+    if unallowed_chars:
+        raise ValueError(
+            f"Unallowed character found in {bound_name} got "
+            f"{', '.join(map(repr, sorted(unallowed_chars)))}"
+        )
 
     code = compile(bound, "<string>", "eval")
-    for name in code.co_names:
-        if name not in allowed_names:
-            raise NameError(
-                "Only pi and exp() are allowed in " f"{bound_name} got {name}"
-            )
-
-    bound_expr = sym.sympify(bound, {"__builtins__": {}}, allowed_names, evaluate=True)
+    unallowed_names = set(code.co_names) - _BOUND_ALLOWED_NAMES.keys()
+    if unallowed_names:
+        raise NameError(
+            "Only pi and exp() are allowed in "
+            f"{bound_name} got {', '.join(sorted(unallowed_names))}"
+        )
+
+    bound_expr = _sympify_bound(bound)
     if not bound_expr.is_real:
         raise ValueError(f"{bound_name} must be a real value got " f"{bound_expr}")
 
@@ -83,62 +128,42 @@ def _validate_function(function: str, function_name: str) -> sym.Expr:
             the input string.
         SympifyError: The expression could not be parsed by SymPy.
     """
-    allowed_chars = [
-        *"cos",
-        *"sin",
-        *"tan",
-        *"csc",
-        *"sec",
-        *"cot",
-        "h",
-        *"exp",
-        *"log",
-        *"pi",
-        "u",
-        "v",
-        *"0123456789",
-        *".+-*/^()",
-        " ",
-    ]
-    allowed_names = {
-        "cos": sym.cos,
-        "sin": sym.sin,
-        "tan": sym.tan,
-        "csc": sym.csc,
-        "sec": sym.sec,
-        "cot": sym.cot,
-        "cosh": sym.cosh,
-        "sinh": sym.sinh,
-        "tanh": sym.tanh,
-        "csch": sym.csch,
-        "sech": sym.sech,
-        "coth": sym.coth,
-        "exp": sym.exp,
-        "log": sym.log,
-        "pi": sym.pi,
-        "u": u,
-        "v": v,
-    }
-
-    if not all([char in allowed_chars for char in function]):
-        raise ValueError(f"Unallowed character found in {function_name}")
+    unallowed_chars = set(function) - _FUNCTION_ALLOWED_CHARS
+    if unallowed_chars:
+        raise ValueError(
+            f"Unallowed character found in {function_name} got "
+            f"{', '.join(map(repr, sorted(unallowed_chars)))}"
+        )
 
     code = compile(function, "<string>", "eval")
-    for name in code.co_names:
-        if name not in allowed_names:
-            raise NameError(
-                f"{name} not allowed. Only trigonometric, "
-                "hyperbolic, exp, and log functions, "
-                "variables u and v, and pi as a constant "
-                f"are allowed in {function_name} got "
-                f"{name}"
-            )
-
-    function_expr = sym.sympify(function, {"__builtins__": {}}, allowed_names)
+    unallowed_names = set(code.co_names) - _FUNCTION_ALLOWED_NAMES.keys()
+    if unallowed_names:
+        names = ", ".join(sorted(unallowed_names))
+        raise NameError(
+            f"{names} not allowed. Only trigonometric, "
+            "hyperbolic, exp, and log functions, "
+            "variables u and v, and pi as a constant "
+            f"are allowed in {function_name} got "
+            f"{names}"
+        )
+
+    function_expr = _sympify_function(function)
 
     return function_expr
 
 
+@lru_cache(maxsize=128)
+def _sympify_bound(bound: str) -> sym.Expr:
+    """Parse a validated bound, reusing the result for repeated input."""
+    return sym.sympify(bound, {"__builtins__": {}}, _BOUND_ALLOWED_NAMES, evaluate=True)
+
+
+@lru_cache(maxsize=128)
+def _sympify_function(function: str) -> sym.Expr:
+    """Parse a validated function, reusing the result for repeated input."""
+    return sym.sympify(function, {"__builtins__": {}}, _FUNCTION_ALLOWED_NAMES)
+
+
 def get_function() -> Tuple[Expression, Range, Range]:
     """Prompt the user to input a parameterized equation.
 
@@ -1,4 +1,8 @@
 """Contains useful functions that are used throughout the Gauss map project."""
+import math
+from functools import lru_cache
+from typing import Any, Tuple, Union
+
 import numpy as np
 import numpy.typing as npt
 import sympy as sym
@@ -11,7 +15,7 @@ def is_u_function(vectorization: Vectorization, u_range: Range, v_range: Range)
     """Determine whether a vectorized function is a function of u.
 
     Args:
-        vectorization: A tuple of vectorized functions.
+        vectorization: A vectorized function.
         u_range: A tuple containing the starting and ending u
         coordinates.
         v_range: A tuple containing the starting and ending v
@@ -24,19 +28,17 @@ def is_u_function(vectorization: Vectorization, u_range: Range, v_range: Range)
     u_values = np.linspace(u_range[0], u_range[1])
     v_value = (v_range[1] - v_range[0]) / 2
 
-    evaluations = [evaluate(vectorization, u_value, v_value) for u_value in u_values]
+    evaluations = evaluate(vectorization, u_values, v_value)
 
     # Does changing u give different outputs?
-    return not np.all(
-        [np.allclose(evaluation, evaluations[0]) for evaluation in evaluations]
-    )
+    return not np.allclose(evaluations, evaluations[0])
 
 
 def is_v_function(vectorization: Vectorization, u_range: Range, v_range: Range) -> bool:
     """Determine whether a vectorized function is a function of v.
 
     Args:
-        vectorization: A tuple of vectorized functions.
+        vectorization: A vectorized function.
         u_range: A tuple containing the starting and ending u
         coordinates.
         v_range: A tuple containing the starting and ending v
@@ -49,12 +51,10 @@ def is_v_function(vectorization: Vectorization, u_range: Range, v_range: Range)
     u_value = (u_range[1] - u_range[0]) / 2
     v_values = np.linspace(v_range[0], v_range[1])
 
-    evaluations = [evaluate(vectorization, u_value, v_value) for v_value in v_values]
+    evaluations = evaluate(vectorization, u_value, v_values)
 
     # Does changing v give different outputs?
-    return not np.all(
-        [np.allclose(evaluation, evaluations[0]) for evaluation in evaluations]
-    )
+    return not np.allclose(evaluations, evaluations[0])
 
 
 def is_inward_field(
@@ -68,9 +68,9 @@ def is_inward_field(
     """Determine whether a normal vector field is oriented inward.
 
     Args:
-        vectorization: A tuple of vectorized functions representing
+        vectorization: A vectorized function representing
             points on the original surface.
-        normal_vectorization: A tuple of vectorized functions representing
+        normal_vectorization: A vectorized function representing
             normal vectors of the surface.
         u_range: A tuple containing the starting and ending u coordinates.
         v_range: A tuple containing the starting and ending v coordinates.
@@ -82,65 +82,160 @@ def is_inward_field(
     u_values = np.linspace(u_range[0], u_range[1], u_amount)
     v_values = np.linspace(v_range[0], v_range[1], v_amount)
 
-    is_pointing_inward_array = np.zeros(shape=(u_amount, v_amount))
-    is_pointing_inward_negative_array = np.zeros(shape=(u_amount, v_amount))
-    for i, u_value in enumerate(u_values):
-        for j, v_value in enumerate(v_values):
-            evaluation = evaluate(vectorization, u_value, v_value)
-            normal_evaluation = evaluate(normal_vectorization, u_value, v_value)
-            negative_normal_evaluation = -1 * normal_evaluation
-            is_pointing_inward_array[i, j] = is_pointing_inward(
-                evaluation, normal_evaluation
-            )
-            is_pointing_inward_negative_array[i, j] = is_pointing_inward(
-                evaluation, negative_normal_evaluation
-            )
+    # Check every sample at once
+    evaluations = evaluate_grid(vectorization, u_values, v_values)
+    normal_evaluations = evaluate_grid(normal_vectorization, u_values, v_values)
 
-    amount_inward = np.count_nonzero(is_pointing_inward_array)
-    amount_inward_negative = np.count_nonzero(is_pointing_inward_negative_array)
+    amount_inward = np.count_nonzero(
+        is_pointing_inward(evaluations, normal_evaluations)
+    )
+    amount_inward_negative = np.count_nonzero(
+        is_pointing_inward(evaluations, -normal_evaluations)
+    )
 
-    return amount_inward > amount_inward_negative
+    return bool(amount_inward > amount_inward_negative)
 
 
 def is_pointing_inward(
     point: npt.NDArray[np.float64], vector: npt.NDArray[np.float64]
-) -> bool:
+) -> Union[bool, npt.NDArray[np.bool_]]:
     """Determine whether a normal vector is pointing towards the origin.
 
     Args:
-        point: A NumPy array of the coordinates of a point.
+        point: A NumPy array of the coordinates of a point. Arrays of
+            points hold the x, y, and z coordinates along the last axis.
         vector: A NumPy array of the components of the normal vector at
-            that point.
+            that point, with the same shape as point.
 
     Returns:
         A boolean that is true when the vector is pointing inwards and
-        false when it is pointing outwards.
+        false when it is pointing outwards. Arrays of points give an array
+        of booleans with one per point.
     """
-    norm = np.linalg.norm(point)
+    point_norm = np.linalg.norm(point, axis=-1, keepdims=True)
     vector = normalize(vector)
 
     # Does following the vector get us closer to the origin?
-    new_point = point + 0.1 * norm * vector
+    new_point = point + 0.1 * point_norm * vector
 
-    return np.linalg.norm(new_point) < norm
+    return np.linalg.norm(new_point, axis=-1) < point_norm[..., 0]
 
 
 def evaluate(
-    vectorization: Vectorization, u_value: float, v_value: float
+    vectorization: Vectorization, u_value: npt.ArrayLike, v_value: npt.ArrayLike
 ) -> npt.NDArray[np.float64]:
     """Evaluate the vectorized function at the given coordinates.
 
     Args:
-        V: A tuple of vectorized functions to be evaluated.
-        u_i: The u coordinate to evaluate at.
-        v_i: The v coordinate to evaluate at.
+        vectorization: A vectorized function to be evaluated.
+        u_value: The u coordinate to evaluate at. Arrays of coordinates are
+            evaluated elementwise.
+        v_value: The v coordinate to evaluate at. Arrays of coordinates are
+            evaluated elementwise.
+
+    Returns:
+        A NumPy array of the evaluated points where the last axis holds the
+        x, y, and z coordinates.
+    """
+    evaluation = vectorization(u_value, v_value)
+
+    # Single points need no broadcasting, which is much slower than the
+    # function call itself
+    if np.isscalar(u_value) and np.isscalar(v_value):
+        return np.array(evaluation)
+
+    # Coordinates that are constant or independent of the varying input are
+    # broadcast to the shape of the inputs when they are assigned
+    evaluations = np.empty(np.broadcast(u_value, v_value).shape + (3,))
+    for i, coordinate in enumerate(evaluation):
+        evaluations[..., i] = coordinate
+
+    return evaluations
+
+
+def evaluate_grid(
+    vectorization: Vectorization,
+    u_values: npt.NDArray[np.float64],
+    v_values: npt.NDArray[np.float64],
+) -> npt.NDArray[np.float64]:
+    """Evaluate the vectorized function on every pair of coordinates.
+
+    Args:
+        vectorization: A vectorized function to be evaluated.
+        u_values: A one dimensional NumPy array of u coordinates.
+        v_values: A one dimensional NumPy array of v coordinates.
+
+    Returns:
+        A NumPy array of shape (len(u_values), len(v_values), 3) where the
+        element at [i, j] holds the x, y, and z coordinates evaluated at
+        u_values[i] and v_values[j].
+    """
+    u_grid, v_grid = np.meshgrid(u_values, v_values, indexing="ij")
+
+    return evaluate(vectorization, u_grid, v_grid)
+
+
+def limit_radius(
+    evaluation: npt.NDArray[np.float64], max_radius: float
+) -> npt.NDArray[np.float64]:
+    """Scale points outside of a sphere back onto the sphere.
+
+    Args:
+        evaluation: A NumPy array of points where the last axis holds the
+            x, y, and z coordinates.
+        max_radius: The radius of the sphere centered at the origin.
 
     Returns:
-        A NumPy array of the evaluated values in x, y, and z coordinates.
+        A NumPy array of the same shape where every point further than
+        max_radius from the origin is moved onto the sphere.
     """
-    x, y, z = vectorization
+    radius = np.linalg.norm(evaluation, axis=-1, keepdims=True)
+
+    # Points inside the sphere are scaled by exactly 1
+    return evaluation * (max_radius / np.maximum(radius, max_radius))
+
+
+def negate(vectorization: Vectorization) -> Vectorization:
+    """Negate the vectorized function.
+
+    Args:
+        vectorization: A vectorized function.
+
+    Returns:
+        A vectorized function that evaluates to the negative of the given
+        function.
+    """
+
+    def negative_vectorization(
+        u_value: npt.ArrayLike, v_value: npt.ArrayLike
+    ) -> Tuple[Any, Any, Any]:
+        x, y, z = vectorization(u_value, v_value)
+
+        return -x, -y, -z
+
+    return negative_vectorization
 
-    return np.array([x(u_value, v_value), y(u_value, v_value), z(u_value, v_value)])
+
+def normalize_vectorization(vectorization: Vectorization) -> Vectorization:
+    """Divide the vectorized function by its magnitude.
+
+    Args:
+        vectorization: A vectorized function.
+
+    Returns:
+        A vectorized function that evaluates to the unit vector in the
+        direction of the given function.
+    """
+
+    def unit_vectorization(
+        u_value: npt.ArrayLike, v_value: npt.ArrayLike
+    ) -> Tuple[Any, Any, Any]:
+        x, y, z = vectorization(u_value, v_value)
+        norm = np.sqrt(x**2 + y**2 + z**2)
+
+        return x / norm, y / norm, z / norm
+
+    return unit_vectorization
 
 
 def sympy_to_numpy(expression: Expression) -> Vectorization:
@@ -150,28 +245,64 @@ def sympy_to_numpy(expression: Expression) -> Vectorization:
         expression: A sequence of 3 SymPy expressions to convert.
 
     Returns:
-        A Tuple of NumPy vectorized equations.
+        A vectorized NumPy function returning the x, y, and z coordinates.
     """
-    # iter needed for SymPy matrix type checking
-    x, y, z = iter(expression)
-    x_numpy = sym.lambdify([u, v], x, "numpy")
-    y_numpy = sym.lambdify([u, v], y, "numpy")
-    z_numpy = sym.lambdify([u, v], z, "numpy")
-    x_vectorization = np.vectorize(x_numpy)
-    y_vectorization = np.vectorize(y_numpy)
-    z_vectorization = np.vectorize(z_numpy)
+    return _lambdify(_coordinates(expression))
 
-    return x_vectorization, y_vectorization, z_vectorization
+
+@lru_cache(maxsize=128)
+def _lambdify(expression: Tuple[Any, ...]) -> Vectorization:
+    """Lambdify the coordinates, reusing the result for equal expressions."""
+    x, y, z = expression
+
+    # Lambdifying the coordinates together lets them share common
+    # subexpressions such as cos(u) and sin(v)
+    return sym.lambdify([u, v], (x, y, z), "numpy", cse=True)
+
+
+def norm(vector: npt.NDArray[np.float64]) -> float:
+    """Calculate the magnitude of a vector with 3 components.
+
+    Unlike np.linalg.norm, only vectors with exactly 3 components are
+    accepted. normalize has the same restriction for a single vector.
+
+    Args:
+        vector: A NumPy array of the x, y, and z components of a vector.
+
+    Returns:
+        The magnitude of the vector.
+
+    Raises:
+        ValueError: The vector does not have exactly 3 components.
+    """
+    # Much cheaper than np.linalg.norm for a single 3 element vector
+    x, y, z = vector
+
+    return math.sqrt(x * x + y * y + z * z)
 
 
 def normalize(vector: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
-    """Divide a vector by its magnitude."""
-    norm = np.linalg.norm(vector)
+    """Divide a vector by its magnitude.
+
+    Args:
+        vector: A NumPy array of a vector with 3 components, or of many
+            vectors where the last axis holds the x, y, and z components.
+
+    Returns:
+        A NumPy array of the same shape where every nonzero vector has a
+        magnitude of 1 and zero vectors are left unchanged.
+    """
+    if np.ndim(vector) > 1:
+        norms = np.linalg.norm(vector, axis=-1, keepdims=True)
+
+        return vector / np.where(norms == 0, 1.0, norms)
 
-    if norm == 0:
-        norm = np.float64(1.0)
+    vector_norm = norm(vector)
 
-    return np.divide(vector, norm)
+    if vector_norm == 0:
+        vector_norm = 1.0
+
+    return np.divide(vector, vector_norm)
 
 
 def compute_partials(expression: Expression) -> Matrices:
@@ -188,15 +319,27 @@ def compute_partials(expression: Expression) -> Matrices:
         the partial derivative of the expression with respect to v in terms of
         u and v.
     """
+    partials_u, partials_v = _differentiate(_coordinates(expression))
+
+    # New matrices every call since SymPy matrices are mutable
+    return sym.Matrix(partials_u), sym.Matrix(partials_v)
+
+
+@lru_cache(maxsize=128)
+def _differentiate(expression: Tuple[Any, ...]) -> Tuple[Tuple[Any, ...], ...]:
+    """Differentiate the coordinates, reusing the result for equal expressions."""
+    jacobian = sym.Matrix(expression).jacobian([u, v])
+
+    # Columns are kept as tuples since the cached result must not change
+    partials_u = tuple(jacobian[:, 0])
+    partials_v = tuple(jacobian[:, 1])
+
+    return partials_u, partials_v
+
+
+def _coordinates(expression: Expression) -> Tuple[Any, Any, Any]:
+    """Unpack an expression or matrix into its x, y, and z coordinates."""
     # iter needed for SymPy Matrix type checking
     x, y, z = iter(expression)
-    x_partial_u = sym.diff(x, u)
-    x_partial_v = sym.diff(x, v)
-    y_partial_u = sym.diff(y, u)
-    y_partial_v = sym.diff(y, v)
-    z_partial_u = sym.diff(z, u)
-    z_partial_v = sym.diff(z, v)
-    partial_u_expression = sym.Matrix([x_partial_u, y_partial_u, z_partial_u])
-    partial_v_expression = sym.Matrix([x_partial_v, y_partial_v, z_partial_v])
-
-    return partial_u_expression, partial_v_expression
+
+    return x, y, z
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Sequence, Tuple
 
 import numpy as np
 import sympy as sym
@@ -41,15 +41,15 @@ def test_original_surface_max_radius_smaller() -> None:
         u_values = np.linspace(u_range[0], u_range[1], amount)
         v_values = np.linspace(v_range[0], v_range[1], amount)
 
-        for u_value in u_values:
-            for v_value in v_values:
-                surface_evaluated = utils.evaluate(vectorization, u_value, v_value)
-                surface_norm = np.linalg.norm(surface_evaluated)
-                surface_expected = max_radius * (surface_evaluated / surface_norm)
+        surfaces_evaluated = utils.evaluate_grid(vectorization, u_values, v_values)
+        surface_norms = np.linalg.norm(surfaces_evaluated, axis=-1, keepdims=True)
+        surfaces_expected = surfaces_evaluated * (max_radius / surface_norms)
 
+        for i, u_value in enumerate(u_values):
+            for j, v_value in enumerate(v_values):
                 surface_test = original_surface.func(u_value, v_value)
 
-                assert np.array_equal(surface_test, surface_expected)
+                assert np.array_equal(surface_test, surfaces_expected[i, j])
 
 
 def test_original_surface_max_radius_larger() -> None:
@@ -71,12 +71,13 @@ def test_original_surface_max_radius_larger() -> None:
     u_values = np.linspace(u_range[0], u_range[1], amount)
     v_values = np.linspace(v_range[0], v_range[1], amount)
 
-    for u_value in u_values:
-        for v_value in v_values:
-            surface_expected = utils.evaluate(vectorization, u_value, v_value)
+    surfaces_expected = utils.evaluate_grid(vectorization, u_values, v_values)
+
+    for i, u_value in enumerate(u_values):
+        for j, v_value in enumerate(v_values):
             surface_test = original_surface.func(u_value, v_value)
 
-            assert np.array_equal(surface_test, surface_expected)
+            assert np.array_equal(surface_test, surfaces_expected[i, j])
 
     # maximum radius for cylinder from z=-1 to z=1
     max_radius = np.sqrt(2)
@@ -94,12 +95,13 @@ def test_original_surface_max_radius_larger() -> None:
     u_values = np.linspace(u_range[0], u_range[1], amount)
     v_values = np.linspace(v_range[0], v_range[1], amount)
 
-    for u_value in u_values:
-        for v_value in v_values:
-            surface_expected = utils.evaluate(vectorization, u_value, v_value)
+    surfaces_expected = utils.evaluate_grid(vectorization, u_values, v_values)
+
+    for i, u_value in enumerate(u_values):
+        for j, v_value in enumerate(v_values):
             surface_test = original_surface.func(u_value, v_value)
 
-            assert np.array_equal(surface_test, surface_expected)
+            assert np.array_equal(surface_test, surfaces_expected[i, j])
 
     # major radius + minor radius
     max_radius = 3 + 1
@@ -117,12 +119,122 @@ def test_original_surface_max_radius_larger() -> None:
     u_values = np.linspace(u_range[0], u_range[1], amount)
     v_values = np.linspace(v_range[0], v_range[1], amount)
 
-    for u_value in u_values:
-        for v_value in v_values:
-            surface_expected = utils.evaluate(vectorization, u_value, v_value)
+    surfaces_expected = utils.evaluate_grid(vectorization, u_values, v_values)
+
+    for i, u_value in enumerate(u_values):
+        for j, v_value in enumerate(v_values):
             surface_test = original_surface.func(u_value, v_value)
 
-            assert np.array_equal(surface_test, surface_expected)
+            assert np.array_equal(surface_test, surfaces_expected[i, j])
+
+
+def test_original_surface_grid() -> None:
+    resolution = 32
+    max_radius = 8
+
+    for parameterization in parameterizations.parameterization_list:
+        vectorization = parameterization.vectorization
+        u_range = parameterization.u_range
+        v_range = parameterization.v_range
+
+        original_surface = surfaces.OriginalSurface(
+            vectorization, u_range, v_range, max_radius=max_radius
+        )
+
+        # The grid manim samples is served from the precomputed samples
+        u_values = np.linspace(u_range[0], u_range[1], resolution + 1)
+        v_values = np.linspace(v_range[0], v_range[1], resolution + 1)
+
+        surfaces_evaluated = utils.evaluate_grid(vectorization, u_values, v_values)
+        surfaces_expected = utils.limit_radius(surfaces_evaluated, max_radius)
+
+        for i, u_value in enumerate(u_values):
+            for j, v_value in enumerate(v_values):
+                surface_test = original_surface.func(u_value, v_value)
+
+                assert np.array_equal(surface_test, surfaces_expected[i, j])
+                assert np.linalg.norm(surface_test) <= max_radius + 1e-12
+
+
+def test_original_surface_resolution_pair() -> None:
+    u_resolution = 8
+    v_resolution = 12
+    max_radius = 8
+
+    for parameterization in parameterizations.parameterization_list:
+        vectorization = parameterization.vectorization
+        u_range = parameterization.u_range
+        v_range = parameterization.v_range
+
+        original_surface = surfaces.OriginalSurface(
+            vectorization,
+            u_range,
+            v_range,
+            max_radius=max_radius,
+            resolution=(u_resolution, v_resolution),
+        )
+
+        u_values = np.linspace(u_range[0], u_range[1], u_resolution + 1)
+        v_values = np.linspace(v_range[0], v_range[1], v_resolution + 1)
+
+        surfaces_evaluated = utils.evaluate_grid(vectorization, u_values, v_values)
+        surfaces_expected = utils.limit_radius(surfaces_evaluated, max_radius)
+
+        for i, u_value in enumerate(u_values):
+            for j, v_value in enumerate(v_values):
+                surface_test = original_surface.func(u_value, v_value)
+
+                assert np.array_equal(surface_test, surfaces_expected[i, j])
+
+
+def test_original_surface_bezier_handles() -> None:
+    resolution = 8
+    max_radius = 8
+
+    sphere = parameterizations.SphereParameterization()
+
+    u_range = sphere.u_range
+    v_range = sphere.v_range
+
+    evaluations: List[Tuple[float, float]] = []
+
+    def vectorization(u_value: float, v_value: float) -> Sequence[float]:
+        evaluations.append((u_value, v_value))
+        return sphere.vectorization(u_value, v_value)
+
+    original_surface = surfaces.OriginalSurface(
+        vectorization, u_range, v_range, max_radius=max_radius, resolution=resolution
+    )
+
+    # manim evaluates the corners of each face and the handles between them
+    u_values = np.linspace(u_range[0], u_range[1], resolution + 1)
+    v_values = np.linspace(v_range[0], v_range[1], resolution + 1)
+    steps = np.linspace(0, 1, 4)
+
+    evaluations.clear()
+
+    for i in range(resolution):
+        for j in range(resolution):
+            u_1, u_2 = u_values[i : i + 2]
+            v_1, v_2 = v_values[j : j + 2]
+            corners = np.array(
+                [[u_1, v_1], [u_2, v_1], [u_2, v_2], [u_1, v_2], [u_1, v_1]]
+            )
+
+            for step in steps:
+                points = (1 - step) * corners[:-1] + step * corners[1:]
+
+                for u_value, v_value in points:
+                    surface_test = original_surface.func(u_value, v_value)
+                    surface_expected = utils.limit_radius(
+                        utils.evaluate(sphere.vectorization, u_value, v_value),
+                        max_radius,
+                    )
+
+                    assert np.allclose(surface_test, surface_expected)
+
+    # Every one of those points was served from the precomputed samples
+    assert not evaluations
 
 
 def test_gauss_map_surface() -> None:
@@ -140,14 +252,95 @@ def test_gauss_map_surface() -> None:
         u_values = np.linspace(u_range[0], u_range[1], amount)
         v_values = np.linspace(v_range[0], v_range[1], amount)
 
-        for u_value in u_values:
-            for v_value in v_values:
-                normal_evaluated = utils.evaluate(
-                    normal_vectorization, u_value, v_value
-                )
-                unit_normal_expected = utils.normalize(normal_evaluated)
+        normals_evaluated = utils.evaluate_grid(
+            normal_vectorization, u_values, v_values
+        )
+        unit_normals_expected = utils.normalize(normals_evaluated)
+
+        for i, u_value in enumerate(u_values):
+            for j, v_value in enumerate(v_values):
+                unit_normal_test = gauss_map_surface.func(u_value, v_value)
+
+                assert np.array_equal(unit_normal_test, unit_normals_expected[i, j])
+
+
+def test_gauss_map_surface_grid() -> None:
+    resolution = 32
+
+    for parameterization in parameterizations.parameterization_list:
+        normal_vectorization = parameterization.normal_vectorization
+        u_range = parameterization.u_range
+        v_range = parameterization.v_range
+
+        gauss_map_surface = surfaces.GaussMapSurface(
+            normal_vectorization, u_range, v_range
+        )
+
+        # The grid manim samples is served from the precomputed samples
+        u_values = np.linspace(u_range[0], u_range[1], resolution + 1)
+        v_values = np.linspace(v_range[0], v_range[1], resolution + 1)
+
+        normals_evaluated = utils.evaluate_grid(
+            normal_vectorization, u_values, v_values
+        )
+        unit_normals_expected = utils.normalize(normals_evaluated)
+
+        for i, u_value in enumerate(u_values):
+            for j, v_value in enumerate(v_values):
+                unit_normal_test = gauss_map_surface.func(u_value, v_value)
+
+                assert np.array_equal(unit_normal_test, unit_normals_expected[i, j])
+
+
+def test_gauss_map_surface_resolution_pair() -> None:
+    u_resolution = 8
+    v_resolution = 12
+
+    for parameterization in parameterizations.parameterization_list:
+        normal_vectorization = parameterization.normal_vectorization
+        u_range = parameterization.u_range
+        v_range = parameterization.v_range
+
+        gauss_map_surface = surfaces.GaussMapSurface(
+            normal_vectorization,
+            u_range,
+            v_range,
+            resolution=(u_resolution, v_resolution),
+        )
+
+        u_values = np.linspace(u_range[0], u_range[1], u_resolution + 1)
+        v_values = np.linspace(v_range[0], v_range[1], v_resolution + 1)
+
+        normals_evaluated = utils.evaluate_grid(
+            normal_vectorization, u_values, v_values
+        )
+        unit_normals_expected = utils.normalize(normals_evaluated)
+
+        for i, u_value in enumerate(u_values):
+            for j, v_value in enumerate(v_values):
                 unit_normal_test = gauss_map_surface.func(u_value, v_value)
 
+                assert np.array_equal(unit_normal_test, unit_normals_expected[i, j])
+
+
+def test_gauss_map_parametric_function_grid() -> None:
+    for parameterization in parameterizations.parameterization_list:
+        if parameterization.is_gauss_map_1d:
+            normal_vectorization = parameterization.normal_vectorization
+            u_range = parameterization.u_range
+
+            gauss_map_function = surfaces.GaussMapParametricFunction(
+                normal_vectorization, u_range, True
+            )
+
+            # The t values manim samples are served from the precomputed samples
+            t_values = np.append(np.arange(u_range[0], u_range[1], 0.01), u_range[1])
+
+            for t_value in t_values:
+                normal_evaluated = utils.evaluate(normal_vectorization, t_value, 1)
+                unit_normal_expected = utils.normalize(normal_evaluated)
+                unit_normal_test = gauss_map_function.func(t_value)
+
                 assert np.array_equal(unit_normal_test, unit_normal_expected)
 
 
@@ -0,0 +1,106 @@
+import numpy as np
+import sympy as sym
+
+from gaussmap import parameterizations
+from gaussmap.utils import utils
+
+
+def test_normal_expression() -> None:
+    amount = 20
+
+    for parameterization in parameterizations.parameterization_list:
+        partial_u_expression = sym.Matrix(parameterization.partial_u_expression)
+        partial_v_expression = sym.Matrix(parameterization.partial_v_expression)
+        normal_expression = partial_u_expression.cross(partial_v_expression)
+
+        normal_vectorization_expected = utils.sympy_to_numpy(normal_expression)
+        normal_vectorization_test = utils.sympy_to_numpy(
+            parameterization.normal_expression
+        )
+        u_range = parameterization.u_range
+        v_range = parameterization.v_range
+
+        u_values = np.linspace(u_range[0], u_range[1], amount)
+        v_values = np.linspace(v_range[0], v_range[1], amount)
+
+        for u_value in u_values:
+            for v_value in v_values:
+                normal_evaluation_test = utils.evaluate(
+                    normal_vectorization_test, u_value, v_value
+                )
+                normal_evaluation_expected = utils.evaluate(
+                    normal_vectorization_expected, u_value, v_value
+                )
+                assert np.allclose(normal_evaluation_test, normal_evaluation_expected)
+
+
+def test_vectorizations() -> None:
+    amount = 20
+
+    for parameterization in parameterizations.parameterization_list:
+        vectorization_expected = utils.sympy_to_numpy(parameterization.expression)
+        normal_vectorization_expected = utils.sympy_to_numpy(
+            parameterization.normal_expression
+        )
+        u_range = parameterization.u_range
+        v_range = parameterization.v_range
+
+        u_values = np.linspace(u_range[0], u_range[1], amount)
+        v_values = np.linspace(v_range[0], v_range[1], amount)
+
+        for u_value in u_values:
+            for v_value in v_values:
+                evaluation_test = utils.evaluate(
+                    parameterization.vectorization, u_value, v_value
+                )
+                evaluation_expected = utils.evaluate(
+                    vectorization_expected, u_value, v_value
+                )
+                assert np.allclose(evaluation_test, evaluation_expected)
+
+                normal_evaluation_test = utils.evaluate(
+                    parameterization.normal_vectorization, u_value, v_value
+                )
+                normal_evaluation_expected = utils.evaluate(
+                    normal_vectorization_expected, u_value, v_value
+                )
+                assert np.allclose(normal_evaluation_test, normal_evaluation_expected)
+
+
+def test_unit_normal_vectorization() -> None:
+    amount = 20
+
+    for parameterization in parameterizations.parameterization_list:
+        unit_normal_vectorization = parameterization.unit_normal_vectorization
+        u_range = parameterization.u_range
+        v_range = parameterization.v_range
+
+        assert parameterization.unit_normal_vectorization is unit_normal_vectorization
+
+        u_values = np.linspace(u_range[0], u_range[1], amount)
+        v_values = np.linspace(v_range[0], v_range[1], amount)
+
+        for u_value in u_values:
+            for v_value in v_values:
+                normal_evaluation = utils.evaluate(
+                    parameterization.normal_vectorization, u_value, v_value
+                )
+                unit_normal_expected = utils.normalize(normal_evaluation)
+                unit_normal_test = utils.evaluate(
+                    unit_normal_vectorization, u_value, v_value
+                )
+                assert np.allclose(unit_normal_test, unit_normal_expected)
+
+
+def test_gauss_map_functions() -> None:
+    for parameterization in parameterizations.parameterization_list:
+        unit_normal_vectorization = parameterization.unit_normal_vectorization
+        u_range = parameterization.u_range
+        v_range = parameterization.v_range
+
+        is_u_function = utils.is_u_function(unit_normal_vectorization, u_range, v_range)
+        is_v_function = utils.is_v_function(unit_normal_vectorization, u_range, v_range)
+
+        assert parameterization.is_gauss_map_u_function == is_u_function
+        assert parameterization.is_gauss_map_v_function == is_v_function
+        assert parameterization.is_gauss_map_1d == (is_u_function != is_v_function)
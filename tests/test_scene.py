@@ -54,13 +54,119 @@ def test_scene(monkeypatch: pytest.MonkeyPatch) -> None:
                 normal_vectorization, u_range, v_range
             )
 
-            u_values = np.linspace(u_range[0], u_range[1], amount)
-            v_values = np.linspace(v_range[0], v_range[1], amount)
-            for u_value in u_values:
-                for v_value in v_values:
-                    test = gauss_map_surface.func(u_value, v_value)
-                    if parameterization.is_gauss_map_inward:
-                        expected = -1 * gauss_map_surface_positive.func(
+            if parameterization.is_gauss_map_inward:
+                u_values = np.linspace(u_range[0], u_range[1], amount)
+                v_values = np.linspace(v_range[0], v_range[1], amount)
+
+                test = np.empty((amount, amount, 3))
+                expected = np.empty_like(test)
+                for i, u_value in enumerate(u_values):
+                    for j, v_value in enumerate(v_values):
+                        test[i, j] = gauss_map_surface.func(u_value, v_value)
+                        expected[i, j] = -1 * gauss_map_surface_positive.func(
                             u_value, v_value
                         )
-                        assert np.allclose(test, expected)
+
+                assert np.allclose(test, expected)
+
+
+def test_scene_parameterization() -> None:
+    amount = 20
+
+    for parameterization in parameterizations.parameterization_list:
+        expression = sym.Matrix(parameterization.expression)
+        u_range = parameterization.u_range
+        v_range = parameterization.v_range
+
+        scene_expected = scene.GaussMapScene(expression, u_range, v_range)
+        scene_test = scene.GaussMapScene(parameterization, u_range, v_range)
+
+        if parameterization.is_gauss_map_1d:
+            gauss_map_function_test = scene_test.gauss_map_function
+            gauss_map_function_expected = scene_expected.gauss_map_function
+
+            assert scene_test.gauss_map_surface is None
+            assert gauss_map_function_test is not None
+            assert gauss_map_function_expected is not None
+
+            t_values = np.linspace(u_range[0], u_range[1], amount)
+            test = np.array([gauss_map_function_test.func(t) for t in t_values])
+            expected = np.array([gauss_map_function_expected.func(t) for t in t_values])
+            assert np.allclose(test, expected)
+        else:
+            gauss_map_surface_test = scene_test.gauss_map_surface
+            gauss_map_surface_expected = scene_expected.gauss_map_surface
+
+            assert gauss_map_surface_test is not None
+            assert gauss_map_surface_expected is not None
+            assert scene_test.gauss_map_function is None
+
+            u_values = np.linspace(u_range[0], u_range[1], amount)
+            v_values = np.linspace(v_range[0], v_range[1], amount)
+
+            test = np.empty((amount, amount, 3))
+            expected = np.empty_like(test)
+            for i, u_value in enumerate(u_values):
+                for j, v_value in enumerate(v_values):
+                    test[i, j] = gauss_map_surface_test.func(u_value, v_value)
+                    expected[i, j] = gauss_map_surface_expected.func(u_value, v_value)
+
+            assert np.allclose(test, expected)
+
+
+def test_scene_parameterization_ranges() -> None:
+    amount = 20
+
+    # Over the inner half of the torus the outward normals point inwards
+    ring_torus = parameterizations.RingTorusParameterization()
+    expression = sym.Matrix(ring_torus.expression)
+    u_range = (3 * np.pi / 4, 5 * np.pi / 4)
+    v_range = ring_torus.v_range
+
+    scene_expected = scene.GaussMapScene(expression, u_range, v_range)
+    scene_test = scene.GaussMapScene(ring_torus, u_range, v_range)
+
+    gauss_map_surface_test = scene_test.gauss_map_surface
+    gauss_map_surface_expected = scene_expected.gauss_map_surface
+
+    assert gauss_map_surface_test is not None
+    assert gauss_map_surface_expected is not None
+
+    u_values = np.linspace(u_range[0], u_range[1], amount)
+    v_values = np.linspace(v_range[0], v_range[1], amount)
+
+    test = np.empty((amount, amount, 3))
+    expected = np.empty_like(test)
+    for i, u_value in enumerate(u_values):
+        for j, v_value in enumerate(v_values):
+            test[i, j] = gauss_map_surface_test.func(u_value, v_value)
+            expected[i, j] = gauss_map_surface_expected.func(u_value, v_value)
+
+    assert np.allclose(test, expected)
+
+
+def test_parameterization_scene() -> None:
+    amount = 20
+
+    class CylinderScene(scene.ParameterizationScene):
+        parameterization_class = parameterizations.CylinderParameterization
+
+    cylinder = parameterizations.CylinderParameterization()
+    u_range = cylinder.u_range
+    v_range = cylinder.v_range
+
+    scene_expected = scene.GaussMapScene(cylinder, u_range, v_range)
+    scene_test = CylinderScene()
+
+    gauss_map_function_test = scene_test.gauss_map_function
+    gauss_map_function_expected = scene_expected.gauss_map_function
+
+    assert scene_test.gauss_map_surface is None
+    assert gauss_map_function_test is not None
+    assert gauss_map_function_expected is not None
+
+    t_values = np.linspace(u_range[0], u_range[1], amount)
+    for t_value in t_values:
+        test = gauss_map_function_test.func(t_value)
+        expected = gauss_map_function_expected.func(t_value)
+        assert np.array_equal(test, expected)
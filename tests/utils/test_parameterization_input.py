@@ -1,3 +1,5 @@
+import re
+
 import numpy as np
 import pytest
 import sympy as sym
@@ -98,6 +100,15 @@ def test_validate_bounds_too_large() -> None:
     assert np.isclose(bound, 100)
 
 
+def test_validate_bounds_repeated(capsys: pytest.CaptureFixture[str]) -> None:
+    for _ in range(2):
+        bound = parameterization_input._validate_bound(bound="101", bound_name="u_max")
+        assert np.isclose(bound, 100)
+
+        # Repeated input is still reported each time
+        assert "u_max too large" in capsys.readouterr().out
+
+
 def test_validate_bounds_real() -> None:
     with pytest.raises(ValueError):
         parameterization_input._validate_bound(bound="(-1)^(0.5)", bound_name="v_min")
@@ -128,6 +139,12 @@ def test_validate_function_allowed() -> None:
     assert function == log(12345) * exp(67890)
 
 
+def test_validate_function_repeated() -> None:
+    function = parameterization_input._validate_function("cos(u) * sin(v)", "x")
+
+    assert parameterization_input._validate_function("cos(u) * sin(v)", "y") is function
+
+
 def test_validate_function_unallowed_chars() -> None:
     with pytest.raises(ValueError):
         # https://xkcd.com/327/
@@ -135,6 +152,14 @@ def test_validate_function_unallowed_chars() -> None:
             function="Robert'); DROP TABLE Students;--", function_name="x"
         )
 
+    # The error names the characters that are not allowed
+    with pytest.raises(ValueError, match="Unallowed character found in y got ';', '_'"):
+        parameterization_input._validate_function(function="u;_v", function_name="y")
+
+    # Whitespace is shown escaped rather than invisibly
+    with pytest.raises(ValueError, match=re.escape("got '\\t'")):
+        parameterization_input._validate_function(function="u\tv", function_name="y")
+
 
 def test_validate_function_unallowed_names() -> None:
     with pytest.raises(NameError):
@@ -147,6 +172,12 @@ def test_validate_function_unallowed_names() -> None:
             function="exculpation(constantine)", function_name="crime"
         )
 
+    # Every name that is not allowed is reported at once
+    with pytest.raises(NameError, match="acsc, asin not allowed"):
+        parameterization_input._validate_function(
+            function="acsc(asin(u)*v)", function_name="y"
+        )
+
 
 def test_validate_function_syntax_error() -> None:
     with pytest.raises(SyntaxError):
@@ -1,4 +1,8 @@
+import gc
+import linecache
+
 import numpy as np
+import pytest
 import sympy as sym
 from sympy.abc import u, v
 
@@ -16,10 +20,7 @@ def test_is_u_function() -> None:
 
         assert utils.is_u_function(normal_vectorization, u_range, v_range)
         if parameterization.is_gauss_map_1d:
-            normal_expression = sym.Matrix(parameterization.normal_expression)
-            normal_expression_norm = sym.sqrt(normal_expression.dot(normal_expression))
-            unit_normal_expression = normal_expression / normal_expression_norm
-            unit_normal_vectorization = utils.sympy_to_numpy(unit_normal_expression)
+            unit_normal_vectorization = parameterization.unit_normal_vectorization
             assert not utils.is_v_function(unit_normal_vectorization, u_range, v_range)
 
 
@@ -33,10 +34,10 @@ def test_is_v_function() -> None:
 
         assert utils.is_v_function(normal_vectorization, v_range, u_range)
         if parameterization.is_gauss_map_1d:
-            normal_expression_norm = sym.sqrt(normal_expression.dot(normal_expression))
-            unit_normal_expression = normal_expression / normal_expression_norm
-            normal_vectorization = utils.sympy_to_numpy(unit_normal_expression)
-            assert not utils.is_u_function(normal_vectorization, v_range, u_range)
+            unit_normal_vectorization = utils.normalize_vectorization(
+                normal_vectorization
+            )
+            assert not utils.is_u_function(unit_normal_vectorization, v_range, u_range)
 
 
 def test_is_inward_field() -> None:
@@ -70,16 +71,19 @@ def test_is_pointing_inward() -> None:
     scaled_inward_vectors = scalars * inward_vectors
     scaled_outward_vectors = scalars * outward_vectors
 
-    for i in range(amount):
-        assert utils.is_pointing_inward(scaled_points[i], scaled_inward_vectors[i])
-        assert not utils.is_pointing_inward(scaled_points[i], scaled_outward_vectors[i])
+    # A single point gives a single boolean
+    assert utils.is_pointing_inward(scaled_points[0], scaled_inward_vectors[0])
+    assert not utils.is_pointing_inward(scaled_points[0], scaled_outward_vectors[0])
 
-        assert utils.is_pointing_inward(
-            -1 * scaled_points[i], -1 * scaled_inward_vectors[i]
-        )
-        assert not utils.is_pointing_inward(
-            -1 * scaled_points[i], -1 * outward_vectors[i]
-        )
+    assert np.all(utils.is_pointing_inward(scaled_points, scaled_inward_vectors))
+    assert not np.any(utils.is_pointing_inward(scaled_points, scaled_outward_vectors))
+
+    assert np.all(
+        utils.is_pointing_inward(-1 * scaled_points, -1 * scaled_inward_vectors)
+    )
+    assert not np.any(
+        utils.is_pointing_inward(-1 * scaled_points, -1 * outward_vectors)
+    )
 
 
 def test_evaluate() -> None:
@@ -96,20 +100,155 @@ def test_evaluate() -> None:
     scaled_u = np.concatenate((scaled_u, -1 * scaled_u), axis=1)
     scaled_v = np.concatenate((scaled_v, -1 * scaled_v), axis=1)
 
+    # Every pair of rows from scaled_u and scaled_v evaluated at once
+    u_values = scaled_u[:, np.newaxis, :]
+    v_values = scaled_v[np.newaxis, :, :]
+    shape = (amount, amount, 2)
+
+    # A sample of the points is also evaluated one at a time
+    i_values = generator.integers(amount, size=amount)
+    j_values = generator.integers(amount, size=amount)
+    k_values = generator.integers(2, size=amount)
+
+    for parameterization in parameterizations.parameterization_list:
+        vectorization = parameterization.vectorization
+
+        x_values, y_values, z_values = vectorization(u_values, v_values)
+        evaluation_expected = np.stack(
+            [
+                np.broadcast_to(x_values, shape),
+                np.broadcast_to(y_values, shape),
+                np.broadcast_to(z_values, shape),
+            ],
+            axis=-1,
+        )
+        evaluation_test = utils.evaluate(vectorization, u_values, v_values)
+
+        assert np.array_equal(evaluation_test, evaluation_expected)
+
+        for i, j, k in zip(i_values, j_values, k_values):
+            evaluation_expected = utils.evaluate(
+                vectorization, scaled_u[i, k], scaled_v[j, k]
+            )
+            assert np.allclose(evaluation_test[i, j, k], evaluation_expected)
+
+
+def test_evaluate_independent() -> None:
+    amount = 20
+
+    # The cylinder's normal vectors do not depend on v
+    cylinder = parameterizations.CylinderParameterization()
+    normal_vectorization = cylinder.normal_vectorization
+    v_values = np.linspace(cylinder.v_range[0], cylinder.v_range[1], amount)
+
+    evaluations = utils.evaluate(normal_vectorization, 1, v_values)
+
+    assert evaluations.shape == (amount, 3)
+    for evaluation in evaluations:
+        assert np.array_equal(evaluation, utils.evaluate(normal_vectorization, 1, 0))
+
+
+def test_evaluate_grid() -> None:
+    amount = 20
+
     for parameterization in parameterizations.parameterization_list:
         vectorization = parameterization.vectorization
+        u_range = parameterization.u_range
+        v_range = parameterization.v_range
+
+        u_values = np.linspace(u_range[0], u_range[1], amount)
+        v_values = np.linspace(v_range[0], v_range[1], 2 * amount)
+
+        evaluations = utils.evaluate_grid(vectorization, u_values, v_values)
+
+        assert evaluations.shape == (amount, 2 * amount, 3)
+        for i, u_value in enumerate(u_values):
+            for j, v_value in enumerate(v_values):
+                evaluation_expected = utils.evaluate(vectorization, u_value, v_value)
+                assert np.allclose(evaluations[i, j], evaluation_expected)
+
+
+def test_limit_radius() -> None:
+    amount = 100
+    max_radius = 2
+
+    points = generator.normal(size=(amount, 3))
+    points_limited = utils.limit_radius(points, max_radius)
 
-        for u_value in scaled_u:
-            for v_value in scaled_v:
-                x_value = vectorization[0](u_value, v_value)
-                y_value = vectorization[1](u_value, v_value)
-                z_value = vectorization[2](u_value, v_value)
-                evaluation_expected = [x_value, y_value, z_value]
-                evaluation_test = utils.evaluate(vectorization, u_value, v_value)
+    norms = np.linalg.norm(points, axis=-1)
+    norms_limited = np.linalg.norm(points_limited, axis=-1)
 
+    inside = norms <= max_radius
+    assert np.array_equal(points_limited[inside], points[inside])
+    assert np.allclose(norms_limited[~inside], max_radius)
+    assert np.allclose(
+        points_limited[~inside] / norms_limited[~inside, None],
+        points[~inside] / norms[~inside, None],
+    )
+
+    for point, point_limited in zip(points, points_limited):
+        assert np.array_equal(utils.limit_radius(point, max_radius), point_limited)
+
+
+def test_normalize_batched() -> None:
+    vectors = generator.normal(size=(10, 10, 3))
+    vectors[0, 0] = 0
+
+    vectors_normalized = utils.normalize(vectors)
+
+    assert vectors_normalized.shape == vectors.shape
+    for i in range(10):
+        for j in range(10):
+            vector_expected = utils.normalize(vectors[i, j])
+            assert np.array_equal(vectors_normalized[i, j], vector_expected)
+
+
+def test_negate() -> None:
+    amount = 20
+
+    for parameterization in parameterizations.parameterization_list:
+        normal_vectorization = parameterization.normal_vectorization
+        negative_normal_vectorization = utils.negate(normal_vectorization)
+        u_range = parameterization.u_range
+        v_range = parameterization.v_range
+
+        u_values = np.linspace(u_range[0], u_range[1], amount)
+        v_values = np.linspace(v_range[0], v_range[1], amount)
+
+        for u_value in u_values:
+            for v_value in v_values:
+                evaluation_expected = -1 * utils.evaluate(
+                    normal_vectorization, u_value, v_value
+                )
+                evaluation_test = utils.evaluate(
+                    negative_normal_vectorization, u_value, v_value
+                )
                 assert np.array_equal(evaluation_test, evaluation_expected)
 
 
+def test_normalize_vectorization() -> None:
+    amount = 20
+
+    for parameterization in parameterizations.parameterization_list:
+        normal_vectorization = parameterization.normal_vectorization
+        unit_normal_vectorization = utils.normalize_vectorization(normal_vectorization)
+        u_range = parameterization.u_range
+        v_range = parameterization.v_range
+
+        u_values = np.linspace(u_range[0], u_range[1], amount)
+        v_values = np.linspace(v_range[0], v_range[1], amount)
+
+        for u_value in u_values:
+            for v_value in v_values:
+                evaluation_expected = utils.normalize(
+                    utils.evaluate(normal_vectorization, u_value, v_value)
+                )
+                evaluation_test = utils.evaluate(
+                    unit_normal_vectorization, u_value, v_value
+                )
+                assert np.allclose(evaluation_test, evaluation_expected)
+
+
 def test_sympy_to_numpy() -> None:
     amount = 100
     max_scalar = 20
@@ -124,18 +263,61 @@ def test_sympy_to_numpy() -> None:
     scaled_u = np.concatenate((scaled_u, -1 * scaled_u), axis=1)
     scaled_v = np.concatenate((scaled_v, -1 * scaled_v), axis=1)
 
+    # Every pair of rows from scaled_u and scaled_v evaluated at once
+    u_values = scaled_u[:, np.newaxis, :]
+    v_values = scaled_v[np.newaxis, :, :]
+
     for parameterization in parameterizations.parameterization_list:
         expression = parameterization.expression
         vectorization_expected = parameterization.vectorization
         vectorization_test = utils.sympy_to_numpy(expression)
 
-        for u_value in scaled_u:
-            for v_value in scaled_v:
-                evaluation_expected = utils.evaluate(
-                    vectorization_expected, u_value, v_value
-                )
-                evaluation_test = utils.evaluate(vectorization_test, u_value, v_value)
-                assert np.allclose(evaluation_test, evaluation_expected)
+        evaluation_expected = utils.evaluate(vectorization_expected, u_values, v_values)
+        evaluation_test = utils.evaluate(vectorization_test, u_values, v_values)
+        assert np.allclose(evaluation_test, evaluation_expected)
+
+
+def test_sympy_to_numpy_cached() -> None:
+    for parameterization in parameterizations.parameterization_list:
+        expression = parameterization.expression
+
+        vectorization = utils.sympy_to_numpy(expression)
+
+        assert utils.sympy_to_numpy(expression) is vectorization
+        assert utils.sympy_to_numpy(sym.Matrix(expression)) is vectorization
+
+
+def test_sympy_to_numpy_linecache() -> None:
+    amount = 300
+    max_cached = 128
+
+    def count_generated() -> int:
+        return sum(name.startswith("<lambdifygenerated") for name in linecache.cache)
+
+    count_before = count_generated()
+
+    for k in range(amount):
+        utils.sympy_to_numpy((u + k, v, u * v))
+
+    gc.collect()
+
+    # Functions evicted from the cache take their linecache entries with them
+    assert count_generated() <= count_before + max_cached
+
+
+def test_norm() -> None:
+    vectors = generator.normal(size=(100, 3))
+
+    for vector in vectors:
+        assert utils.norm(vector) == np.linalg.norm(vector[np.newaxis], axis=-1)[0]
+        assert np.isclose(utils.norm(vector), np.linalg.norm(vector))
+
+    assert utils.norm(np.array([0, 0, 0])) == 0
+    assert utils.norm(np.array([2, 3, 6])) == 7
+
+    # Only vectors with exactly 3 components are accepted
+    with pytest.raises(ValueError):
+        utils.norm(np.array([3, 4]))
 
 
 def test_normalize_zero_vector() -> None:
@@ -163,20 +345,20 @@ def test_normalize_single_axis() -> None:
 
     print(x_vectors[0])
 
-    for i in range(amount):
-        norm_x = utils.normalize(x_vectors[i])
-        norm_y = utils.normalize(y_vectors[i])
-        norm_z = utils.normalize(z_vectors[i])
-        assert np.array_equal(norm_x, x_vector)
-        assert np.array_equal(norm_y, y_vector)
-        assert np.array_equal(norm_z, z_vector)
+    # Every vector is normalized in one call
+    norm_x = utils.normalize(x_vectors)
+    norm_y = utils.normalize(y_vectors)
+    norm_z = utils.normalize(z_vectors)
+    assert np.array_equal(norm_x, np.broadcast_to(x_vector, x_vectors.shape))
+    assert np.array_equal(norm_y, np.broadcast_to(y_vector, y_vectors.shape))
+    assert np.array_equal(norm_z, np.broadcast_to(z_vector, z_vectors.shape))
 
-        norm_x = utils.normalize(-1 * x_vectors[i])
-        norm_y = utils.normalize(-1 * y_vectors[i])
-        norm_z = utils.normalize(-1 * z_vectors[i])
-        assert np.array_equal(norm_x, -1 * x_vector)
-        assert np.array_equal(norm_y, -1 * y_vector)
-        assert np.array_equal(norm_z, -1 * z_vector)
+    norm_x = utils.normalize(-1 * x_vectors)
+    norm_y = utils.normalize(-1 * y_vectors)
+    norm_z = utils.normalize(-1 * z_vectors)
+    assert np.array_equal(norm_x, np.broadcast_to(-1 * x_vector, x_vectors.shape))
+    assert np.array_equal(norm_y, np.broadcast_to(-1 * y_vector, y_vectors.shape))
+    assert np.array_equal(norm_z, np.broadcast_to(-1 * z_vector, z_vectors.shape))
 
 
 def test_normalize_dual_axis() -> None:
@@ -209,9 +391,8 @@ def test_normalize_dual_axis() -> None:
 
     scaled_vectors = scalars * vectors
 
-    for i in range(amount):
-        norm = utils.normalize(scaled_vectors[i])
-        assert np.allclose(norm, vectors[i])
+    norms = utils.normalize(scaled_vectors)
+    assert np.allclose(norms, vectors)
 
 
 def test_normalize_dual_axis_uneven() -> None:
@@ -258,9 +439,8 @@ def test_normalize_dual_axis_uneven() -> None:
 
     scaled_vectors = scalars * vectors
 
-    for i in range(amount):
-        norm = utils.normalize(scaled_vectors[i])
-        assert np.allclose(norm, vectors[i])
+    norms = utils.normalize(scaled_vectors)
+    assert np.allclose(norms, vectors)
 
 
 def test_compute_partials() -> None:
@@ -273,3 +453,15 @@ def test_compute_partials() -> None:
 
         assert partials_test[0].equals(sym.Matrix(partial_u_expression_expected))
         assert partials_test[1].equals(sym.Matrix(partial_v_expression_expected))
+
+
+def test_compute_partials_cached() -> None:
+    expression = parameterizations.SphereParameterization().expression
+
+    partials_first = utils.compute_partials(expression)
+    partials_first[0][0] = 0
+    partials_second = utils.compute_partials(expression)
+
+    # Changing a returned matrix does not change later results
+    assert partials_second[0] is not partials_first[0]
+    assert partials_second[0][0] != 0